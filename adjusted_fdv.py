@@ -1,19 +1,14 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-# Page configuration
-st.set_page_config(
-    page_title="Adjusted Fully Diluted Value (FDV) Calculator",
-    page_icon="📈",
-    layout="wide"
-)
-
-st.title("Adjusted Fully Diluted Value (FDV) Calculator")
-
-# Add some visual styling to make the description stand out
-st.markdown("""
+# Introductory banner shown under the page title
+_BANNER_HTML = """
 <div style="
     background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 50%, #e8edf2 100%); 
     padding: 25px; 
@@ -30,30 +25,65 @@ st.markdown("""
         Using this framework, we adjust the FDV based on two critical factors: our expected holding period and the impact of staking rewards over that holding period. The outcome is an adjusted FDV that uses the projected circulating supply of tokens at the end of the expected holding period, and also accounts for how staking rewards effectively reduce the cost basis by increasing token holdings for the same initial investment.
     </p>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+# Page configuration
+st.set_page_config(
+    page_title="Adjusted Fully Diluted Value (FDV) Calculator",
+    page_icon="📈",
+    layout="wide"
+)
+
+st.title("Adjusted Fully Diluted Value (FDV) Calculator")
+
+# Add some visual styling to make the description stand out
+st.markdown(_BANNER_HTML, unsafe_allow_html=True)
+
+@st.cache_resource
+def _session():
+    """
+    Shared HTTP session so repeat calls to api.tao.app reuse the connection
+    """
+    session = requests.Session()
+    session.headers.update({'accept': 'application/json'})
+    return session
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_screener(api_key):
+    """
+    Fetch the subnet screener once and index its rows by netuid
+    """
+    response = _session().get('https://api.tao.app/api/beta/subnet_screener', headers={'X-API-Key': api_key}, timeout=10)
+    response.raise_for_status()
+
+    data = orjson.loads(response.content)
+
+    return {subnet['netuid']: subnet for subnet in data}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_valuation(subnet_id, api_key):
+    """
+    Fetch the latest valuation entry for a given subnet ID
+    """
+    url = f'https://api.tao.app/api/beta/analytics/subnets/valuation?netuid={subnet_id}&page=1&page_size=1'
+    response = _session().get(url, headers={'X-API-Key': api_key}, timeout=10)
+    response.raise_for_status()
+
+    return orjson.loads(response.content)
 
 def fetch_subnet_data(subnet_id, api_key):
     """
     Fetch current circulating supply for a given subnet ID
     """
     try:
-        headers = {
-            'accept': 'application/json',
-            'X-API-Key': api_key
-        }
-        
-        response = requests.get('https://api.tao.app/api/beta/subnet_screener', headers=headers)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Find the subnet with matching netuid
-        for subnet in data:
-            if subnet['netuid'] == int(subnet_id):
-                return subnet['alpha_circ']
-        
-        return None
-        
+        target = int(subnet_id)
+        screener = _fetch_screener(api_key)
+
+        # Look up the subnet with matching netuid
+        subnet = screener.get(target)
+
+        return subnet['alpha_circ'] if subnet is not None else None
+
     except Exception as e:
         st.error(f"Error fetching subnet data: {str(e)}")
         return None
@@ -63,107 +93,188 @@ def fetch_fdv_data(subnet_id, api_key):
     Fetch current FDV in USD for a given subnet ID
     """
     try:
-        headers = {
-            'accept': 'application/json',
-            'X-API-Key': api_key
-        }
-        
-        url = f'https://api.tao.app/api/beta/analytics/subnets/valuation?netuid={subnet_id}&page=1&page_size=100'
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        data = response.json()
-        
+        data = _fetch_valuation(subnet_id, api_key)
+
         # Get the latest (first) entry
         if data['data'] and len(data['data']) > 0:
             return data['data'][0]['alpha_fdv_usd']
-        
+
         return None
-        
+
     except Exception as e:
         st.error(f"Error fetching FDV data: {str(e)}")
         return None
 
-def calculate_alpha_growth(subnet_id, initial_holdings, weeks, start_alpha_supply,
-                          alpha_injection_param, alpha_in_pool_param, avg_root_staked_tao):
+def _weekly_reward_rates(weeks, start_alpha_supply,
+                         alpha_injection_param, alpha_in_pool_param, avg_root_staked_tao):
     """
-    Calculate Alpha token growth over time based on staking rewards.
+    Compute the per-week staking reward rate, which depends only on total supply.
     """
-    current_holdings = initial_holdings
-    weekly_data = []
-    
-    # Initialize end_total_supply for the first iteration
-    end_total_supply = 0
-
-    for week in range(weeks):
-        # Start of Period Total Alpha Supply
-        start_total_supply = start_alpha_supply if week == 0 else end_total_supply
-
-        # End of Period Total Alpha Supply
-        end_total_supply = start_total_supply + 7200*7 + 7200*7*alpha_injection_param
+    weeks_idx = np.arange(weeks)
 
-        # Start of Period Alpha Out Supply
-        start_out_supply = start_total_supply * (1 - alpha_in_pool_param)
+    # Total Alpha emitted per week (base emission plus pool injection)
+    weekly_emission = 7200*7*(1 + alpha_injection_param)
 
-        # End of Period Alpha Out Supply
-        end_out_supply = end_total_supply * (1 - alpha_in_pool_param)
+    # Root TAO weight and fraction of Alpha held outside the pool, constant across weeks
+    root_tao_weight = avg_root_staked_tao * 0.18
+    out_frac = 1 - alpha_in_pool_param
 
-        # Average Alpha Out Supply
-        avg_out_supply = (start_out_supply + end_out_supply) / 2
+    # Start and End of Period Total Alpha Supply
+    start_total_supply = start_alpha_supply + weeks_idx * weekly_emission
+    end_total_supply = start_total_supply + weekly_emission
 
-        # Start of Period Root Proportion
-        start_root_proportion = (avg_root_staked_tao * 0.18) / (avg_root_staked_tao * 0.18 + start_total_supply)
+    # Alpha Out Supply grows by a constant amount each week, so only its average is needed
+    out_emission = weekly_emission * out_frac
+    avg_out_supply = (start_total_supply + weekly_emission / 2) * out_frac
 
-        # Start of Period Alpha Proportion
-        start_alpha_proportion = 1 - start_root_proportion
+    # Start and End of Period Alpha Proportion
+    start_alpha_proportion = 1 - root_tao_weight / (root_tao_weight + start_total_supply)
+    end_alpha_proportion = 1 - root_tao_weight / (root_tao_weight + end_total_supply)
 
-        # End of Period Root Proportion
-        end_root_proportion = (avg_root_staked_tao * 0.18) / (avg_root_staked_tao * 0.18 + end_total_supply)
+    # Period Average Alpha Proportion
+    period_avg_alpha_proportion = (start_alpha_proportion + end_alpha_proportion) / 2
 
-        # End of Period Alpha Proportion
-        end_alpha_proportion = 1 - end_root_proportion
+    # Period Alpha Proportion Adjusted Alpha Staking Rewards
+    period_staking_rewards = out_emission * 0.41 * period_avg_alpha_proportion
 
-        # Period Average Alpha Proportion
-        period_avg_alpha_proportion = (start_alpha_proportion + end_alpha_proportion) / 2
+    return period_staking_rewards / avg_out_supply
 
-        # Period Alpha Proportion Adjusted Alpha Staking Rewards
-        period_staking_rewards = (end_out_supply - start_out_supply) * 0.41 * period_avg_alpha_proportion
+def final_holdings_only(weeks, initial_holdings, start_alpha_supply,
+                        alpha_injection_param, alpha_in_pool_param, avg_root_staked_tao):
+    """
+    Compute final Alpha holdings after compounding weekly staking rewards.
+    """
+    weekly_rate = _weekly_reward_rates(
+        weeks, start_alpha_supply, alpha_injection_param, alpha_in_pool_param, avg_root_staked_tao
+    )
+    return float(initial_holdings * np.prod(1 + weekly_rate))
 
-        # Alpha Staking Rewards for user
-        user_staking_rewards = (current_holdings / avg_out_supply) * period_staking_rewards
+def full_breakdown(weeks, initial_holdings, start_alpha_supply,
+                   alpha_injection_param, alpha_in_pool_param, avg_root_staked_tao):
+    """
+    Compute the weekly holdings series as arrays of start holdings, rewards, end holdings and APR.
+    """
+    weekly_rate = _weekly_reward_rates(
+        weeks, start_alpha_supply, alpha_injection_param, alpha_in_pool_param, avg_root_staked_tao
+    )
 
-        # Alpha Holdings (After Staking Rewards)
-        new_holdings = current_holdings + user_staking_rewards
+    # Weekly reward rate is independent of holdings, so holdings compound as a running product
+    end_holdings = initial_holdings * np.cumprod(1 + weekly_rate)
+    start_holdings = np.concatenate(([initial_holdings], end_holdings[:-1]))
 
-        # Alpha APR
-        alpha_apr = user_staking_rewards / current_holdings if current_holdings > 0 else 0
+    # Alpha Staking Rewards for user
+    user_staking_rewards = end_holdings - start_holdings
 
-        # APY
-        apy = alpha_apr * 52
+    # Alpha APR (clamped denominator gives zero when there are no holdings to earn on)
+    alpha_apr = np.divide(user_staking_rewards, np.maximum(start_holdings, 1e-18))
 
-        # Store weekly data
-        weekly_data.append({
-            'Week': week + 1,
-            'Start_Holdings': current_holdings,
-            'Staking_Rewards': user_staking_rewards,
-            'End_Holdings': new_holdings,
-            'Weekly_APR': alpha_apr,
-            'Annualized_APY': apy
-        })
+    return start_holdings, user_staking_rewards, end_holdings, alpha_apr
 
-        # Update holdings for next week
-        current_holdings = new_holdings
-        start_alpha_supply = end_total_supply
+@st.cache_data(max_entries=32, show_spinner=False)
+def calculate_alpha_growth(subnet_id, initial_holdings, weeks, start_alpha_supply,
+                          alpha_injection_param, alpha_in_pool_param, avg_root_staked_tao):
+    """
+    Calculate Alpha token growth over time based on staking rewards.
+    """
+    final_holdings = final_holdings_only(
+        weeks, initial_holdings, start_alpha_supply,
+        alpha_injection_param, alpha_in_pool_param, avg_root_staked_tao
+    )
 
     return {
         'subnet_id': subnet_id,
         'initial_holdings': initial_holdings,
-        'final_holdings': current_holdings,
+        'final_holdings': final_holdings,
         'weeks_analyzed': weeks,
-        'total_rewards': current_holdings - initial_holdings,
-        'weekly_data': weekly_data
+        'total_rewards': final_holdings - initial_holdings,
+        'start_alpha_supply': start_alpha_supply,
+        'alpha_injection_param': alpha_injection_param,
+        'alpha_in_pool_param': alpha_in_pool_param,
+        'avg_root_staked_tao': avg_root_staked_tao
+    }
+
+def build_weekly_df(results):
+    """
+    Build the weekly breakdown table for the inputs recorded by calculate_alpha_growth.
+    """
+    start_holdings, user_staking_rewards, end_holdings, alpha_apr = full_breakdown(
+        results['weeks_analyzed'], results['initial_holdings'], results['start_alpha_supply'],
+        results['alpha_injection_param'], results['alpha_in_pool_param'], results['avg_root_staked_tao']
+    )
+
+    return pd.DataFrame({
+        'Week': np.arange(1, results['weeks_analyzed'] + 1),
+        'Start_Holdings': start_holdings,
+        'Staking_Rewards': user_staking_rewards,
+        'End_Holdings': end_holdings,
+        'Weekly_APR': alpha_apr,
+        'Annualized_APY': alpha_apr * 52
+    })
+
+def compute_fdv_metrics(start_alpha_supply, weeks, initial_holdings, tao_investment,
+                        final_holdings, current_fdv_usd, alpha_injection_param):
+    """
+    Calculate cost basis and adjusted FDV metrics. Inputs broadcast, so weeks (with a
+    matching final_holdings) may be an array to evaluate several analysis periods at once.
+    """
+    initial_holdings = np.asarray(initial_holdings, dtype=np.float64)
+    final_holdings = np.asarray(final_holdings, dtype=np.float64)
+
+    # Cost basis calculations (zero when there are no holdings)
+    initial_cost_basis = np.where(initial_holdings > 0, tao_investment / np.maximum(initial_holdings, 1e-18), 0.0)
+    adjusted_cost_basis = np.where(final_holdings > 0, tao_investment / np.maximum(final_holdings, 1e-18), 0.0)
+    cost_basis_decrease = np.where(
+        initial_cost_basis > 0,
+        (initial_cost_basis - adjusted_cost_basis) / np.maximum(initial_cost_basis, 1e-18) * 100,
+        0.0
+    )
+
+    # FDV calculations
+    max_supply = 21_000_000
+    final_circulating_supply = start_alpha_supply + np.asarray(weeks) * (7200*7*(1 + alpha_injection_param))
+    fdv_multiplier = final_circulating_supply / max_supply
+    effective_fdv_multiplier = fdv_multiplier * (1 - (cost_basis_decrease / 100))
+    total_effective_discount = (1 - effective_fdv_multiplier) * 100
+
+    metrics = {
+        'initial_cost_basis': initial_cost_basis,
+        'adjusted_cost_basis': adjusted_cost_basis,
+        'cost_basis_decrease': cost_basis_decrease,
+        'final_circulating_supply': final_circulating_supply,
+        'circulating_supply_percentage': fdv_multiplier * 100,
+        'supply_discount': (1 - fdv_multiplier) * 100,
+        'staking_discount': cost_basis_decrease,
+        'total_effective_discount': total_effective_discount,
+        'adjusted_fdv_usd': current_fdv_usd * (1 - (total_effective_discount / 100))
     }
 
+    # Unwrap zero-dimensional results so scalar inputs give scalar outputs
+    return {name: value[()] for name, value in metrics.items()}
+
+@dataclass(slots=True)
+class FDVResults:
+    """
+    Growth results and derived FDV metrics from the last calculation.
+    """
+    results: dict
+    current_fdv_usd: float
+    total_effective_discount: float
+    adjusted_fdv_usd: float
+    initial_cost_basis: float
+    adjusted_cost_basis: float
+    cost_basis_decrease: float
+    final_circulating_supply: float
+    circulating_supply_percentage: float
+    supply_discount: float
+    staking_discount: float
+
+def metric_row(items):
+    """
+    Render a row of st.metric cards, one column per (label, value[, delta]) tuple.
+    """
+    for col, item in zip(st.columns(len(items)), items):
+        col.metric(*item)
+
 # Input Section
 st.header("Input Parameters")
 
@@ -186,27 +297,32 @@ data_source = st.radio(
     key="data_source_radio"  # Add explicit key for better state management
 )
 
-# Initialize variables
+# Only the inputs for the selected source are rendered. Re-assigning their stored values
+# keeps them in session state while hidden, so toggling the source does not reset them.
+for key, default in (("api_key", ""), ("manual_supply", 1925000.0), ("manual_fdv", 135000000.0)):
+    st.session_state[key] = st.session_state.get(key, default)
+
 api_key = None
-manual_supply = 1925000.0  # Default value
-manual_fdv = 135000000.0   # Default value
-
-if data_source == "Use API (requires tao.app API key)":
-    api_key = st.text_input(
-        "Enter your TAO API Key", 
-        type="password",
-        help="Get your API key from tao.app. This will be used to automatically fetch current circulating supply and FDV data.",
-        key="api_key_input"
-    )
-    if not api_key:
-        st.warning("⚠️ Please enter your API key to use automatic data fetching.")
-else:
-    st.info("💡 You can find current subnet data at tao.app or other Bittensor data sources.")
-    col1, col2 = st.columns(2)
-    with col1:
-        manual_supply = st.number_input("Current Circulating Supply of Alpha", value=1925000.0, min_value=0.0, step=10000.0, key="manual_supply_input")
-    with col2:
-        manual_fdv = st.number_input("Current FDV (in USD)", value=135000000.0, min_value=0.0, step=1000000.0, format="%.0f", key="manual_fdv_input")
+manual_supply = None
+manual_fdv = None
+
+with st.container():
+    if data_source == "Use API (requires tao.app API key)":
+        api_key = st.text_input(
+            "Enter your TAO API Key", 
+            type="password",
+            help="Get your API key from tao.app. This will be used to automatically fetch current circulating supply and FDV data.",
+            key="api_key"
+        )
+        if not api_key:
+            st.warning("⚠️ Please enter your API key to use automatic data fetching.")
+    else:
+        st.info("💡 You can find current subnet data at tao.app or other Bittensor data sources.")
+        col1, col2 = st.columns(2)
+        with col1:
+            manual_supply = st.number_input("Current Circulating Supply of Alpha", min_value=0.0, step=10000.0, key="manual_supply")
+        with col2:
+            manual_fdv = st.number_input("Current FDV (in USD)", min_value=0.0, step=1000000.0, format="%.0f", key="manual_fdv")
 
 # Hardcoded optional parameters
 alpha_injection_param = 0.75
@@ -223,9 +339,14 @@ if st.button("Calculate Analysis", type="primary"):
             st.stop()
             
         # Fetch data from APIs
+        # The two endpoints are independent, so fetch them concurrently. Worker threads
+        # inherit the script context so st.error inside the fetchers still renders.
         with st.spinner("Fetching subnet data..."):
-            start_alpha_supply = fetch_subnet_data(subnet_id, api_key)
-            current_fdv_usd = fetch_fdv_data(subnet_id, api_key)
+            with ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx,
+                                    initargs=(None, get_script_run_ctx())) as executor:
+                supply_future = executor.submit(fetch_subnet_data, subnet_id, api_key)
+                fdv_future = executor.submit(fetch_fdv_data, subnet_id, api_key)
+                start_alpha_supply, current_fdv_usd = supply_future.result(), fdv_future.result()
         
         if start_alpha_supply is None or current_fdv_usd is None:
             st.error(f"❌ Could not fetch data for Subnet ID {subnet_id}. Please check your API key and subnet ID, or try entering data manually.")
@@ -262,37 +383,27 @@ if st.button("Calculate Analysis", type="primary"):
         )
 
     # Calculate all metrics upfront
-    # Cost basis calculations
-    initial_cost_basis = tao_investment / initial_holdings if initial_holdings > 0 else 0
-    adjusted_cost_basis = tao_investment / results['final_holdings'] if results['final_holdings'] > 0 else 0
-    cost_basis_decrease = ((initial_cost_basis - adjusted_cost_basis) / initial_cost_basis * 100) if initial_cost_basis > 0 else 0
-
-    # FDV calculations
-    max_supply = 21_000_000
-    final_circulating_supply = start_alpha_supply + (weeks * (7200*7 + 7200*7*alpha_injection_param))
-    circulating_supply_percentage = (final_circulating_supply / max_supply) * 100
-    fdv_multiplier = final_circulating_supply / max_supply
-    supply_discount = (1 - fdv_multiplier) * 100
-    staking_discount = cost_basis_decrease
-    effective_fdv_multiplier = fdv_multiplier * (1 - (cost_basis_decrease / 100))
-    total_effective_discount = (1 - effective_fdv_multiplier) * 100
-    adjusted_fdv_usd = current_fdv_usd * (1 - (total_effective_discount / 100))
+    metrics = compute_fdv_metrics(
+        start_alpha_supply=start_alpha_supply,
+        weeks=weeks,
+        initial_holdings=initial_holdings,
+        tao_investment=tao_investment,
+        final_holdings=results['final_holdings'],
+        current_fdv_usd=current_fdv_usd,
+        alpha_injection_param=alpha_injection_param
+    )
 
     # Store results in session state
-    st.session_state.results = results
-    st.session_state.current_fdv_usd = current_fdv_usd
-    st.session_state.total_effective_discount = total_effective_discount
-    st.session_state.adjusted_fdv_usd = adjusted_fdv_usd
-    st.session_state.initial_cost_basis = initial_cost_basis
-    st.session_state.adjusted_cost_basis = adjusted_cost_basis
-    st.session_state.cost_basis_decrease = cost_basis_decrease
-    st.session_state.final_circulating_supply = final_circulating_supply
-    st.session_state.circulating_supply_percentage = circulating_supply_percentage
-    st.session_state.supply_discount = supply_discount
-    st.session_state.staking_discount = staking_discount
+    st.session_state.fdv = FDVResults(
+        results=results,
+        current_fdv_usd=current_fdv_usd,
+        **metrics
+    )
+    st.session_state.pop('weekly_df', None)
 
 # Display results if they exist
-if 'results' in st.session_state:
+if 'fdv' in st.session_state:
+    r = st.session_state.fdv
     st.markdown("---")
     st.header("Adjusted Fully Diluted Valuation",
               help="Shows the resulting adjusted valuation based on the projected circulating supply at the end of the analysis period and staking reward benefits.")
@@ -301,7 +412,7 @@ if 'results' in st.session_state:
     col1, col2, col3 = st.columns([1, 1, 1])
     
     with col2:
-        st.metric("Adjusted FDV", f"${st.session_state.adjusted_fdv_usd:,.0f}")
+        st.metric("Adjusted FDV", f"${r.adjusted_fdv_usd:,.0f}")
 
     st.markdown("")
     st.markdown("---")
@@ -309,28 +420,18 @@ if 'results' in st.session_state:
                  help="Shows how your Alpha holdings grow through staking rewards and how this reduces your effective cost basis per token. The adjusted cost basis divides the initial TAO investment by the final Alpha holdings.")
     
     # First row - Holdings and Rewards
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Initial Alpha Holdings", f"{st.session_state.results['initial_holdings']:,.2f}")
-    
-    with col2:
-        st.metric("Final Alpha Holdings", f"{st.session_state.results['final_holdings']:,.2f}", delta=f"{((st.session_state.results['final_holdings'] / st.session_state.results['initial_holdings']) - 1) * 100:.2f}%")
-    
-    with col3:
-        st.metric("Total Rewards Earned", f"{st.session_state.results['total_rewards']:,.2f}")
+    metric_row([
+        ("Initial Alpha Holdings", f"{r.results['initial_holdings']:,.2f}"),
+        ("Final Alpha Holdings", f"{r.results['final_holdings']:,.2f}", f"{((r.results['final_holdings'] / r.results['initial_holdings']) - 1) * 100:.2f}%"),
+        ("Total Rewards Earned", f"{r.results['total_rewards']:,.2f}")
+    ])
 
     # Second row - Cost Basis
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Initial Cost Basis", f"{st.session_state.initial_cost_basis:.4f} TAO per Alpha")
-    
-    with col2:
-        st.metric("Adjusted Cost Basis", f"{st.session_state.adjusted_cost_basis:.4f} TAO per Alpha")
-    
-    with col3:
-        st.metric("Cost Basis Decrease", f"{st.session_state.cost_basis_decrease:.2f}%")
+    metric_row([
+        ("Initial Cost Basis", f"{r.initial_cost_basis:.4f} TAO per Alpha"),
+        ("Adjusted Cost Basis", f"{r.adjusted_cost_basis:.4f} TAO per Alpha"),
+        ("Cost Basis Decrease", f"{r.cost_basis_decrease:.2f}%")
+    ])
 
     st.markdown("")
     st.markdown("---")
@@ -338,42 +439,38 @@ if 'results' in st.session_state:
               help="Detailed breakdown showing projected circulating supply, staking yield effects, and how they combine to create the total effective discount to traditional FDV.")
     
     # First row
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Final Circulating Supply", f"{st.session_state.final_circulating_supply:,.0f} Alpha")
-    
-    with col2:
-        st.metric("% of Max Supply (21M)", f"{st.session_state.circulating_supply_percentage:.1f}%")
-    
-    with col3:
-        st.metric("FDV Discount", f"{st.session_state.supply_discount:.1f}%")
+    metric_row([
+        ("Final Circulating Supply", f"{r.final_circulating_supply:,.0f} Alpha"),
+        ("% of Max Supply (21M)", f"{r.circulating_supply_percentage:.1f}%"),
+        ("FDV Discount", f"{r.supply_discount:.1f}%")
+    ])
     
     # Second row
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Staking Yield Discount (Cost Basis Decrease)", f"{st.session_state.staking_discount:.1f}%")
-    
-    with col2:
-        st.metric("FDV Discount", f"{st.session_state.supply_discount:.1f}%")
-    
-    with col3:
-        st.metric("Total Effective Discount to FDV", f"{st.session_state.total_effective_discount:.1f}%")
+    metric_row([
+        ("Staking Yield Discount (Cost Basis Decrease)", f"{r.staking_discount:.1f}%"),
+        ("FDV Discount", f"{r.supply_discount:.1f}%"),
+        ("Total Effective Discount to FDV", f"{r.total_effective_discount:.1f}%")
+    ])
 
     # Weekly breakdown toggle
     st.markdown("")
     st.markdown("---")
     if st.checkbox("Show Weekly Breakdown"):
         st.markdown("<h3 style='color: #2c3e50; margin: 20px 0;'>Weekly Breakdown</h3>", unsafe_allow_html=True)
-        df = pd.DataFrame(st.session_state.results['weekly_data'])
-        df['Start_Holdings'] = df['Start_Holdings'].round(2)
-        df['Staking_Rewards'] = df['Staking_Rewards'].round(4)
-        df['End_Holdings'] = df['End_Holdings'].round(2)
-        df['Weekly_APR'] = (df['Weekly_APR'] * 100).round(4)
-        df['Annualized_APY'] = (df['Annualized_APY'] * 100).round(2)
-        
-        st.dataframe(df, use_container_width=True)
+        # Build the table on first view only and reuse it while the results are unchanged
+        if 'weekly_df' not in st.session_state:
+            st.session_state.weekly_df = build_weekly_df(r.results)
+
+        st.dataframe(
+            st.session_state.weekly_df.style.format({
+                'Start_Holdings': '{:,.2f}',
+                'Staking_Rewards': '{:,.4f}',
+                'End_Holdings': '{:,.2f}',
+                'Weekly_APR': '{:.4%}',
+                'Annualized_APY': '{:.2%}'
+            }),
+            use_container_width=True
+        )
 
 # Information sidebar
 with st.sidebar: